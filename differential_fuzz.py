@@ -0,0 +1,35 @@
+from importlib import import_module
+import argparse
+import os
+import sys
+
+from src.fuzz import DifferentialFuzzer, TARGETS
+
+
+def load_candidate(spec: str):
+    """Carrega a implementação candidata a partir de 'modulo:atributo'."""
+    module_name, _, attribute = spec.partition(":")
+    candidate = import_module(module_name)
+    for part in attribute.split("."):
+        candidate = getattr(candidate, part)
+    return candidate
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare an optimized engine implementation against the reference on randomized inputs.")
+    parser.add_argument("-t", "--target", required=True, choices=sorted(TARGETS), help="Engine to test.")
+    parser.add_argument("-c", "--candidate", required=True, help="Candidate as 'module:function' or 'module:Class'.")
+    parser.add_argument("-n", "--cases", type=int, default=1_000_000, help="Number of cases to run.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Seed for the input generators.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of worker processes.")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="Cases per worker task.")
+    parser.add_argument("--max-mismatches", type=int, default=10, help="Stop after this many mismatches.")
+    args = parser.parse_args()
+
+    fuzzer = DifferentialFuzzer(TARGETS[args.target], jobs=args.jobs, chunk_size=args.chunk_size)
+    report = fuzzer.run(load_candidate(args.candidate), args.cases, seed=args.seed, max_mismatches=args.max_mismatches)
+
+    print(report)
+    for mismatch in report.mismatches:
+        print(mismatch)
+    sys.exit(1 if report.mismatches else 0)
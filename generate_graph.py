@@ -1,13 +1,148 @@
-from staticfg import CFGBuilder
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 import argparse
+import hashlib
+import json
+import os
+
+CACHE_FILE = ".cfg_cache.json"
+PROJECT_MARKERS = ("pyproject.toml", "setup.py", ".git")
+
+
+def find_modules(source: Path) -> list[Path]:
+    """Lista os módulos Python a analisar: o próprio arquivo ou todos os .py do diretório."""
+    if source.is_file():
+        return [source]
+    return sorted(path for path in source.rglob("*.py") if "__pycache__" not in path.parts)
+
+
+def module_name(path: Path) -> str:
+    """
+    Nomeia o módulo pelo caminho relativo à raiz do projeto (o diretório mais
+    próximo com pyproject.toml, setup.py ou .git), ex.: `src.fraud.__init__`.
+    O nome não depende do diretório analisado nem do diretório de trabalho.
+    """
+    path = path.resolve()
+    root = next(
+        (parent for parent in path.parents if any((parent / marker).exists() for marker in PROJECT_MARKERS)),
+        Path(path.anchor),
+    )
+    return ".".join(path.relative_to(root).with_suffix("").parts)
+
+
+def file_hash(path: Path) -> str:
+    """Calcula o hash do conteúdo de um arquivo."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def cfg_metrics(cfg) -> dict[str, int]:
+    """
+    Conta nós e arestas alcançáveis a partir do bloco de entrada e calcula a
+    complexidade ciclomática. O staticfg deixa cada `return` como um bloco final
+    próprio, então os blocos sem saída são ligados a um nó de saída virtual:
+    (E + X) - (N + 1) + 2 = E - N + 1 + X.
+    """
+    visited = set()
+    to_visit = [cfg.entryblock]
+    edges = 0
+    exit_blocks = 0
+    while to_visit:
+        block = to_visit.pop()
+        if block.id in visited:
+            continue
+        visited.add(block.id)
+        edges += len(block.exits)
+        if not block.exits:
+            exit_blocks += 1
+        to_visit.extend(exit_.target for exit_ in block.exits)
+    nodes = len(visited)
+    complexity = edges - nodes + 1 + max(exit_blocks, 1)
+    return {"nodes": nodes, "edges": edges, "cyclomatic_complexity": complexity}
+
+
+def function_metrics(cfg, prefix: str = "") -> dict[str, dict[str, int]]:
+    """Coleta as métricas de todas as funções, incluindo as aninhadas, pelo nome qualificado."""
+    metrics = {}
+    for name, function_cfg in cfg.functioncfgs.items():
+        metrics[prefix + name] = cfg_metrics(function_cfg)
+        metrics.update(function_metrics(function_cfg, f"{prefix}{name}."))
+    return metrics
+
+
+def process_module(path: Path, name: str, output_dir: Path, render: bool) -> dict[str, dict[str, int]]:
+    """Constrói o CFG de um módulo, renderiza a imagem e retorna as métricas por função."""
+    from staticfg import CFGBuilder
+
+    cfg = CFGBuilder().build_from_file(name, str(path))
+    if render:
+        cfg.build_visual(str(output_dir / name), "png", show=False)
+    return function_metrics(cfg)
+
+
+def generate(source: Path, output_dir: Path, jobs: int, render: bool, name: str | None = None) -> dict:
+    """
+    Gera os CFGs e as métricas de todos os módulos em paralelo, pulando os
+    arquivos cujo conteúdo não mudou desde a última execução.
+
+    O cache acumula as execuções anteriores: só são removidas as entradas de
+    arquivos que não existem mais, e as métricas retornadas cobrem todo o cache.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = output_dir / CACHE_FILE
+    cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
+
+    modules = find_modules(source)
+    results = {key: entry for key, entry in cache.items() if Path(key).exists()}
+    pending = {}
+    failed = []
+    for path in modules:
+        # Chaves absolutas mantêm o cache válido em qualquer diretório de trabalho
+        key = path.resolve().as_posix()
+        output_name = name or module_name(path)
+        digest = file_hash(path)
+        cached = cache.get(key)
+        image_ready = not render or (output_dir / f"{output_name}.png").exists()
+        if not (cached and cached["hash"] == digest and cached["name"] == output_name and image_ready):
+            pending[key] = (path, output_name, digest)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                key: executor.submit(process_module, path, output_name, output_dir, render)
+                for key, (path, output_name, _) in pending.items()
+            }
+            for key, future in futures.items():
+                _, output_name, digest = pending[key]
+                try:
+                    results[key] = {"hash": digest, "name": output_name, "functions": future.result()}
+                except Exception as error:
+                    # Módulos que o staticfg não consegue analisar não entram no cache
+                    results.pop(key, None)
+                    failed.append(key)
+                    print(f"Failed to build CFG for {key}: {error!r}")
+
+    cache_path.write_text(json.dumps(results, indent=2, sort_keys=True))
+    print(f"{len(pending) - len(failed)} module(s) processed, "
+          f"{len(modules) - len(pending)} unchanged, {len(failed)} failed.")
+    return {entry["name"]: entry["functions"] for entry in results.values()}
 
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Generate a control flow graph (CFG) from a Python script.")
-    parser.add_argument("-s", "--script", help="Path to the Python script file.")
-    parser.add_argument("-n", "--name", help="Name for the output CFG image file.", default="cfg_output")
+    parser = argparse.ArgumentParser(description="Generate control flow graphs (CFGs) and complexity metrics for Python sources.")
+    parser.add_argument("-s", "--source", "--script", dest="source", default="src", help="Python file or directory to analyze.")
+    parser.add_argument("-n", "--name", help="Name for the output CFG image file (single file only).")
+    parser.add_argument("-o", "--output", default="cfg", help="Output directory for images, cache and metrics.")
+    parser.add_argument("-m", "--metrics", help="Path of the metrics JSON file (defaults to <output>/metrics.json).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of worker processes.")
+    parser.add_argument("--no-render", action="store_true", help="Only compute metrics, skip Graphviz rendering.")
     args = parser.parse_args()
 
-    cfg = CFGBuilder().build_from_file(args.name, args.script)
+    source = Path(args.source)
+    if args.name and not source.is_file():
+        parser.error("--name can only be used with a single script")
+    output_dir = Path(args.output)
+
+    metrics = generate(source, output_dir, args.jobs, not args.no_render, args.name)
 
-    cfg.build_visual(f"cfg/{args.name}", "png")
+    metrics_path = Path(args.metrics) if args.metrics else output_dir / "metrics.json"
+    metrics_path.write_text(json.dumps(metrics, indent=2, sort_keys=True))
@@ -0,0 +1,68 @@
+import struct
+from operator import attrgetter
+from typing import Iterator
+from src.flight.BookingResult import BookingResult
+from src.fraud.FraudCheckResult import FraudCheckResult
+
+_COUNT = struct.Struct("<I")
+
+
+class RecordCodec:
+    """
+    Codec binário de layout fixo para classes de resultado com `__slots__`.
+
+    Cada registro é empacotado com `struct` na ordem dos slots, que também é a
+    ordem dos argumentos do construtor. Lotes são gravados em um buffer contíguo
+    precedido pela quantidade de registros e lidos via `memoryview`, sem cópias.
+    """
+    def __init__(self, cls: type, fmt: str):
+        self.cls = cls
+        self._struct = struct.Struct(fmt)
+        self._get_fields = attrgetter(*cls.__slots__)
+        self.record_size = self._struct.size
+
+    def encode(self, result) -> bytes:
+        """Empacota um único resultado."""
+        return self._struct.pack(*self._get_fields(result))
+
+    def decode(self, data: bytes | memoryview):
+        """Reconstrói um único resultado a partir de seus bytes."""
+        return self.cls(*self._struct.unpack(data))
+
+    def encode_many(self, results: list) -> bytearray:
+        """Empacota vários resultados em um único buffer contíguo."""
+        buffer = bytearray(_COUNT.size + len(results) * self.record_size)
+        _COUNT.pack_into(buffer, 0, len(results))
+        pack_into = self._struct.pack_into
+        get_fields = self._get_fields
+        offset = _COUNT.size
+        for result in results:
+            pack_into(buffer, offset, *get_fields(result))
+            offset += self.record_size
+        return buffer
+
+    def iter_decode(self, buffer: bytes | bytearray | memoryview) -> Iterator:
+        """Percorre os resultados de um buffer gerado por `encode_many`."""
+        view = memoryview(buffer)
+        (count,) = _COUNT.unpack_from(view)
+        end = _COUNT.size + count * self.record_size
+        if len(view) < end:
+            raise ValueError(f"buffer truncado: esperados {end} bytes, recebidos {len(view)}")
+        cls = self.cls
+        for fields in self._struct.iter_unpack(view[_COUNT.size:end]):
+            yield cls(*fields)
+
+    def decode_many(self, buffer: bytes | bytearray | memoryview) -> list:
+        """Reconstrói todos os resultados de um buffer gerado por `encode_many`."""
+        return list(self.iter_decode(buffer))
+
+    def decode_at(self, buffer: bytes | bytearray | memoryview, index: int):
+        """Lê apenas o resultado na posição informada, sem decodificar o restante."""
+        (count,) = _COUNT.unpack_from(buffer)
+        if not 0 <= index < count:
+            raise IndexError(f"índice {index} fora do intervalo para {count} registros")
+        return self.cls(*self._struct.unpack_from(buffer, _COUNT.size + index * self.record_size))
+
+
+FRAUD_CHECK_RESULT_CODEC = RecordCodec(FraudCheckResult, "<???i")
+BOOKING_RESULT_CODEC = RecordCodec(BookingResult, "<?dd?")
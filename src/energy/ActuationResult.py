@@ -0,0 +1,10 @@
+class ActuationResult:
+    """Armazena os comandos enviados e as falhas de um envio para várias residências."""
+    def __init__(self, sent: dict[str, dict[str, bool]], failures: dict[str, BaseException]):
+        self.sent = sent
+        self.failures = failures
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"ActuationResult(sent={self.sent}, "
+                f"failures={self.failures})")
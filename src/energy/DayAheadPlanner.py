@@ -0,0 +1,87 @@
+import heapq
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import ALWAYS_ON_DEVICES
+from src.energy.EnergyPlan import EnergyPlan
+from src.epoch import from_epoch_seconds
+
+
+class DayAheadPlanner:
+    """Gera um plano horário de consumo a partir da curva de preços do dia seguinte."""
+    def plan(
+        self,
+        start_time: datetime,
+        hourly_prices: list[float],
+        device_priorities: dict[str, int],
+        device_consumption: dict[str, float],
+        energy_usage_limit: float,
+        total_energy_used_today: float,
+        scheduled_devices: list[DeviceSchedule],
+        price_threshold: float | None = None,
+    ) -> EnergyPlan:
+        """
+        Distribui o orçamento de energia entre os dispositivos, hora a hora.
+
+        Segue as mesmas regras de `manage_energy`: dispositivos de prioridade 1
+        nunca são desligados pelo limite, o modo noturno (23h às 6h) mantém
+        apenas Security e Refrigerator e os agendamentos sempre são atendidos.
+        O restante do orçamento é alocado de forma gulosa, priorizando a menor
+        prioridade numérica e, em seguida, as horas mais baratas.
+
+        Lança ValueError se algum dispositivo não tiver consumo informado.
+        """
+        missing = {
+            device for device in device_priorities if device not in device_consumption
+        } | {
+            schedule.device_name for schedule in scheduled_devices
+            if schedule.device_name not in device_consumption
+        }
+        if missing:
+            raise ValueError(f"Consumo não informado para os dispositivos: {sorted(missing)}")
+
+        start = start_time.replace(minute=0, second=0, microsecond=0)
+        slots = len(hourly_prices)
+        hourly_status = [dict.fromkeys(device_priorities, False) for _ in range(slots)]
+        remaining = energy_usage_limit - total_energy_used_today
+        used = 0.0
+        candidates = []
+
+        # 1. Dispositivos essenciais e candidatos a cada hora
+        for slot, price in enumerate(hourly_prices):
+            hour = (start + timedelta(hours=slot)).hour
+            is_night = hour >= 23 or hour < 6
+            is_expensive = price_threshold is not None and price > price_threshold
+            status = hourly_status[slot]
+            for device, priority in device_priorities.items():
+                if is_night and device not in ALWAYS_ON_DEVICES:
+                    continue
+                consumption = device_consumption[device]
+                if priority <= 1:
+                    status[device] = True
+                    used += consumption
+                elif not is_expensive:
+                    candidates.append((priority, price, slot, device, consumption))
+
+        # 2. Agendamentos sempre ligam o dispositivo na hora correspondente
+        for schedule in scheduled_devices:
+            scheduled_time = schedule.scheduled_time
+            if isinstance(scheduled_time, int):
+                scheduled_time = from_epoch_seconds(scheduled_time)
+            slot = (scheduled_time - start) // timedelta(hours=1)
+            if 0 <= slot < slots and not hourly_status[slot].get(schedule.device_name, False):
+                hourly_status[slot][schedule.device_name] = True
+                used += device_consumption[schedule.device_name]
+
+        # 3. Alocação gulosa do orçamento restante
+        remaining -= used
+        heapq.heapify(candidates)
+        while candidates:
+            priority, price, slot, device, consumption = heapq.heappop(candidates)
+            # Dispositivos sem consumo são aceitos mesmo com o orçamento esgotado
+            if hourly_status[slot][device] or consumption > max(remaining, 0.0):
+                continue
+            hourly_status[slot][device] = True
+            remaining -= consumption
+            used += consumption
+
+        return EnergyPlan(start, hourly_status, total_energy_used_today + used)
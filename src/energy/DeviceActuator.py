@@ -0,0 +1,140 @@
+import asyncio
+from itertools import islice
+from src.energy.ActuationResult import ActuationResult
+from src.energy.DeviceGateway import DeviceConnection, DeviceGateway
+from src.energy.EnergyManagementResult import EnergyManagementResult
+
+TRANSIENT_ERRORS = (ConnectionError, OSError, asyncio.TimeoutError)
+
+
+class DeviceActuator:
+    """
+    Aplica os resultados de `manage_energy` nos dispositivos, enviando
+    apenas os dispositivos cujo estado mudou desde o último envio.
+    """
+    def __init__(
+        self,
+        gateway: DeviceGateway,
+        max_connections: int = 4,
+        max_sends_per_second: float | None = None,
+        batch_size: int = 50,
+        max_retries: int = 3,
+        retry_delay: float = 0.05,
+    ):
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.last_applied: dict[str, dict[str, bool]] = {}
+        self._pool = _ConnectionPool(gateway, max_connections)
+        self._rate_limiter = _RateLimiter(max_sends_per_second) if max_sends_per_second else None
+
+    def diff(self, home_id: str, result: EnergyManagementResult) -> dict[str, bool]:
+        """Retorna os dispositivos cujo estado difere do último estado aplicado."""
+        last = self.last_applied.get(home_id, {})
+        return {
+            device: status for device, status in result.device_status.items()
+            if device not in last or last[device] != status
+        }
+
+    async def apply(self, home_id: str, result: EnergyManagementResult) -> dict[str, bool]:
+        """
+        Envia as mudanças de uma residência em lotes e retorna os comandos enviados.
+        O estado aplicado só é atualizado para os lotes confirmados pelo gateway.
+        """
+        changes = self.diff(home_id, result)
+        applied = self.last_applied.setdefault(home_id, {})
+        items = iter(changes.items())
+        while batch := dict(islice(items, self.batch_size)):
+            await self._send_with_retry(home_id, batch)
+            applied.update(batch)
+        return changes
+
+    async def apply_many(self, results: dict[str, EnergyManagementResult]) -> ActuationResult:
+        """
+        Aplica os resultados de várias residências de forma concorrente.
+        A falha de uma residência é registrada sem interromper as demais.
+        """
+        outcomes = await asyncio.gather(
+            *(self.apply(home_id, result) for home_id, result in results.items()),
+            return_exceptions=True,
+        )
+        sent = {}
+        failures = {}
+        for home_id, outcome in zip(results, outcomes):
+            if isinstance(outcome, BaseException):
+                failures[home_id] = outcome
+            else:
+                sent[home_id] = outcome
+        return ActuationResult(sent, failures)
+
+    async def close(self) -> None:
+        """Fecha todas as conexões ociosas do pool."""
+        await self._pool.close()
+
+    async def _send_with_retry(self, home_id: str, batch: dict[str, bool]) -> None:
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.wait()
+            connection = await self._pool.acquire()
+            try:
+                await connection.send(home_id, batch)
+            except BaseException as error:
+                # Qualquer falha, inclusive cancelamento, descarta a conexão e devolve a vaga ao pool;
+                # apenas erros transitórios são repetidos
+                await self._pool.discard(connection)
+                if not isinstance(error, TRANSIENT_ERRORS) or attempt >= self.max_retries:
+                    raise
+            else:
+                self._pool.release(connection)
+                return
+            await asyncio.sleep(self.retry_delay * 2 ** attempt)
+            attempt += 1
+
+
+class _ConnectionPool:
+    def __init__(self, gateway: DeviceGateway, size: int):
+        self._gateway = gateway
+        self._idle: asyncio.Queue[DeviceConnection] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(size)
+
+    async def acquire(self) -> DeviceConnection:
+        await self._slots.acquire()
+        try:
+            if not self._idle.empty():
+                return self._idle.get_nowait()
+            return await self._gateway.connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: DeviceConnection) -> None:
+        self._idle.put_nowait(connection)
+        self._slots.release()
+
+    async def discard(self, connection: DeviceConnection) -> None:
+        try:
+            await connection.close()
+        finally:
+            self._slots.release()
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            connection = self._idle.get_nowait()
+            await connection.close()
+
+
+class _RateLimiter:
+    def __init__(self, max_per_second: float):
+        self._interval = 1.0 / max_per_second
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
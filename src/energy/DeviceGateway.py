@@ -0,0 +1,59 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+
+class DeviceConnection(ABC):
+    """Conexão com um gateway de dispositivos, capaz de enviar comandos liga/desliga."""
+    @abstractmethod
+    async def send(self, home_id: str, commands: dict[str, bool]) -> None:
+        """Envia um lote de comandos para os dispositivos de uma residência."""
+
+    async def close(self) -> None:
+        """Libera os recursos da conexão."""
+        return None
+
+
+class DeviceGateway(ABC):
+    """Ponto de extensão para o transporte dos comandos até os dispositivos."""
+    @abstractmethod
+    async def connect(self) -> DeviceConnection:
+        """Abre uma nova conexão com o gateway."""
+
+
+class FakeDeviceGateway(DeviceGateway):
+    """Gateway em memória, usado em testes e benchmarks."""
+    def __init__(self, failures: int = 0, latency: float = 0.0):
+        self.failures = failures
+        self.latency = latency
+        self.device_state: dict[str, dict[str, bool]] = {}
+        self.sent_batches: list[tuple[str, dict[str, bool]]] = []
+        self.connections_opened = 0
+        self.connections_closed = 0
+
+    async def connect(self) -> DeviceConnection:
+        self.connections_opened += 1
+        return _FakeDeviceConnection(self)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"FakeDeviceGateway(homes={len(self.device_state)}, "
+                f"sent_batches={len(self.sent_batches)}, "
+                f"connections_opened={self.connections_opened})")
+
+
+class _FakeDeviceConnection(DeviceConnection):
+    def __init__(self, gateway: FakeDeviceGateway):
+        self._gateway = gateway
+
+    async def send(self, home_id: str, commands: dict[str, bool]) -> None:
+        if self._gateway.latency:
+            await asyncio.sleep(self._gateway.latency)
+        if self._gateway.failures > 0:
+            self._gateway.failures -= 1
+            raise ConnectionError("falha simulada no gateway")
+        self._gateway.sent_batches.append((home_id, dict(commands)))
+        state = self._gateway.device_state.setdefault(home_id, {})
+        state.update(commands)
+
+    async def close(self) -> None:
+        self._gateway.connections_closed += 1
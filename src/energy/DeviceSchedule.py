@@ -2,8 +2,12 @@ from datetime import datetime
 
 
 class DeviceSchedule:
-    """Representa um agendamento de ativação para um dispositivo."""
-    def __init__(self, device_name: str, scheduled_time: datetime):
+    """
+    Representa um agendamento de ativação para um dispositivo.
+
+    O horário pode ser um datetime ou segundos inteiros desde a época (ver `src.epoch`).
+    """
+    def __init__(self, device_name: str, scheduled_time: datetime | int):
         self.device_name = device_name
         self.scheduled_time = scheduled_time
 
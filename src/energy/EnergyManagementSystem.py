@@ -1,6 +1,10 @@
 from datetime import datetime
 from src.energy.DeviceSchedule import DeviceSchedule
 from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.energy.EnergyPlan import EnergyPlan
+
+# Dispositivos que permanecem ligados durante o modo noturno
+ALWAYS_ON_DEVICES = ("Security", "Refrigerator")
 
 class SmartEnergyManagementSystem:
     """Um sistema para gerenciar inteligentemente o consumo de energia."""
@@ -9,20 +13,26 @@ class SmartEnergyManagementSystem:
         current_price: float,
         price_threshold: float,
         device_priorities: dict[str, int],
-        current_time: datetime,
+        current_time: datetime | int,
         current_temperature: float,
         desired_temperature_range: tuple[float, float],
         energy_usage_limit: float,
         total_energy_used_today: float,
         scheduled_devices: list[DeviceSchedule],
+        plan: EnergyPlan | None = None,
     ) -> EnergyManagementResult:
 
         device_status: dict[str, bool] = {}
         energy_saving_mode = False
         temperature_regulation_active = False
+        planned_status = plan.status_at(current_time) if plan is not None else None
 
         # 1. Ativa o modo de economia de energia se o preço exceder o limite
-        if current_price > price_threshold:
+        if planned_status is not None:
+            # Segue o plano do dia seguinte no lugar da regra de preço
+            energy_saving_mode = current_price > price_threshold
+            device_status.update(planned_status)
+        elif current_price > price_threshold:
             energy_saving_mode = True
             for device, priority in device_priorities.items():
                 if priority > 1:  
@@ -35,9 +45,14 @@ class SmartEnergyManagementSystem:
                 device_status[device] = True
 
         # 2. Modo noturno entre 23h e 6h
-        if current_time.hour >= 23 or current_time.hour < 6:
+        if isinstance(current_time, int):
+            # Modo de tempo inteiro: hora do dia a partir dos segundos desde a época
+            hour = current_time // 3600 % 24
+        else:
+            hour = current_time.hour
+        if hour >= 23 or hour < 6:
             for device in device_priorities:
-                if device not in ("Security", "Refrigerator"):
+                if device not in ALWAYS_ON_DEVICES:
                     device_status[device] = False
 
         # 3. Regulação de temperatura
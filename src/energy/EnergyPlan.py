@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+from src.epoch import from_epoch_seconds
+
+
+class EnergyPlan:
+    """Armazena um plano horário de liga/desliga dos dispositivos para o dia seguinte."""
+    def __init__(
+        self,
+        start_time: datetime,
+        hourly_status: list[dict[str, bool]],
+        planned_energy: float,
+    ):
+        self.start_time = start_time
+        self.hourly_status = hourly_status
+        self.planned_energy = planned_energy
+
+    def status_at(self, current_time: datetime | int) -> dict[str, bool] | None:
+        """
+        Retorna uma cópia do estado planejado para o horário informado,
+        ou None se o horário estiver fora do período coberto pelo plano.
+        """
+        if isinstance(current_time, int):
+            current_time = from_epoch_seconds(current_time)
+        if current_time < self.start_time:
+            return None
+        slot = (current_time - self.start_time) // timedelta(hours=1)
+        if slot >= len(self.hourly_status):
+            return None
+        return dict(self.hourly_status[slot])
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"EnergyPlan(start_time='{self.start_time}', "
+                f"slots={len(self.hourly_status)}, "
+                f"planned_energy={self.planned_energy})")
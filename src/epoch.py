@@ -0,0 +1,27 @@
+import calendar
+from datetime import datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_seconds(moment: datetime) -> int:
+    """
+    Converte um datetime sem fuso em segundos inteiros desde a época.
+
+    O datetime é tratado como horário de parede, de modo que a hora do dia
+    usada pelos motores é preservada. Datetimes com fuso são rejeitados com
+    ValueError, pois a conversão para UTC mudaria a hora local que
+    `manage_energy` usa no modo datetime. Frações de segundo também são
+    rejeitadas: descartá-las mudaria as comparações nas bordas das regras
+    (ex.: 29min59.6s passaria a valer exatamente 30min).
+    """
+    if moment.utcoffset() is not None:
+        raise ValueError("Datetimes com fuso não são suportados; use o horário local sem fuso")
+    if moment.microsecond:
+        raise ValueError("Datetimes com frações de segundo não são suportados; use replace(microsecond=0)")
+    return calendar.timegm(moment.timetuple())
+
+
+def from_epoch_seconds(seconds: int) -> datetime:
+    """Converte segundos desde a época em um datetime sem fuso (horário de parede)."""
+    return EPOCH + timedelta(seconds=seconds)
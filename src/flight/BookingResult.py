@@ -2,12 +2,18 @@ class BookingResult:
     """
     Uma classe para armazenar o resultado de uma operação de reserva de voo.
     """
+    __slots__ = ("confirmation", "total_price", "refund_amount", "points_used")
+
     def __init__(self, confirmation, total_price, refund_amount, points_used):
         self.confirmation = confirmation
         self.total_price = total_price
         self.refund_amount = refund_amount
         self.points_used = points_used
 
+    def _asdict(self) -> dict:
+        """Retorna os campos do resultado em um dicionário, na ordem dos slots (ex.: para JSON)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
     def __repr__(self):
         """Retorna uma representação legível do objeto."""
         return (f"BookingResult(confirmation={self.confirmation}, "
@@ -8,16 +8,17 @@ class FlightBookingSystem:
     def book_flight(
                     self, 
                     passengers: int, 
-                    booking_time: datetime, 
+                    booking_time: datetime | int, 
                     available_seats: int,
                     current_price: float, 
                     previous_sales: int, 
                     is_cancellation: bool,
-                    departure_time: datetime, 
+                    departure_time: datetime | int, 
                     reward_points_available: int
                 ) -> BookingResult:
         """
         Processa a reserva ou cancelamento de um voo com base nos parâmetros fornecidos.
+        Os horários podem ser datetimes ou segundos inteiros desde a época.
         """
         final_price = 0.0
         refund_amount = 0.0
@@ -33,10 +34,18 @@ class FlightBookingSystem:
         final_price = current_price * price_factor * passengers
 
         # Taxa de última hora
-        time_difference = departure_time - booking_time
-        hours_to_departure = time_difference.total_seconds() / 3600
+        if isinstance(booking_time, int):
+            # Modo de tempo inteiro: compara segundos diretamente
+            seconds_to_departure = departure_time - booking_time
+            is_last_minute = seconds_to_departure < 24 * 3600
+            is_full_refund = seconds_to_departure >= 48 * 3600
+        else:
+            time_difference = departure_time - booking_time
+            hours_to_departure = time_difference.total_seconds() / 3600
+            is_last_minute = hours_to_departure < 24
+            is_full_refund = hours_to_departure >= 48
         
-        if hours_to_departure < 24:
+        if is_last_minute:
             final_price += 100
 
         # Desconto para reservas em grupo
@@ -54,7 +63,7 @@ class FlightBookingSystem:
 
         # Lógica para cancelamentos
         if is_cancellation:
-            if hours_to_departure >= 48:
+            if is_full_refund:
                 refund_amount = final_price
             else:
                 refund_amount = final_price * 0.5
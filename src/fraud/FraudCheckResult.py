@@ -1,11 +1,17 @@
 class FraudCheckResult:
     """Armazena os resultados de uma verificação de detecção de fraude."""
+    __slots__ = ("is_fraudulent", "is_blocked", "verification_required", "risk_score")
+
     def __init__(self, is_fraudulent: bool, is_blocked: bool, verification_required: bool, risk_score: int):
         self.is_fraudulent = is_fraudulent
         self.is_blocked = is_blocked
         self.verification_required = verification_required
         self.risk_score = risk_score
 
+    def _asdict(self) -> dict:
+        """Retorna os campos do resultado em um dicionário, na ordem dos slots (ex.: para JSON)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
     def __repr__(self) -> str:
         """Retorna uma representação legível do objeto."""
         return (f"FraudCheckResult(is_fraudulent={self.is_fraudulent}, "
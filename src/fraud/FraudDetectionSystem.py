@@ -12,6 +12,7 @@ class FraudDetectionSystem:
     ) -> FraudCheckResult:
         """
         Verifica a transação atual contra um conjunto de regras para identificar fraudes.
+        Aceita timestamps em datetime ou em segundos inteiros desde a época.
         """
         is_fraudulent = False
         is_blocked = False
@@ -26,11 +27,19 @@ class FraudDetectionSystem:
 
         # 2. Verifica por transações excessivas na última hora
         recent_transaction_count = 0
-        for transaction in previous_transactions:
-            time_difference = current_transaction.timestamp - transaction.timestamp
-            time_diff_minutes = time_difference.total_seconds() / 60
-            if time_diff_minutes <= 60:
-                recent_transaction_count += 1
+        epoch_mode = isinstance(current_transaction.timestamp, int)
+        if epoch_mode:
+            # Modo de tempo inteiro: compara segundos diretamente
+            current_seconds = current_transaction.timestamp
+            for transaction in previous_transactions:
+                if current_seconds - transaction.timestamp <= 3600:
+                    recent_transaction_count += 1
+        else:
+            for transaction in previous_transactions:
+                time_difference = current_transaction.timestamp - transaction.timestamp
+                time_diff_minutes = time_difference.total_seconds() / 60
+                if time_diff_minutes <= 60:
+                    recent_transaction_count += 1
         
         if recent_transaction_count > 10:
             is_blocked = True
@@ -39,10 +48,14 @@ class FraudDetectionSystem:
         # 3. Verifica mudança de localização em um curto período de tempo
         if previous_transactions:
             last_transaction = previous_transactions[-1]
-            time_since_last = current_transaction.timestamp - last_transaction.timestamp
-            minutes_since_last = time_since_last.total_seconds() / 60
+            if epoch_mode:
+                is_short_interval = current_transaction.timestamp - last_transaction.timestamp < 1800
+            else:
+                time_since_last = current_transaction.timestamp - last_transaction.timestamp
+                minutes_since_last = time_since_last.total_seconds() / 60
+                is_short_interval = minutes_since_last < 30
             
-            if minutes_since_last < 30 and last_transaction.location != current_transaction.location:
+            if is_short_interval and last_transaction.location != current_transaction.location:
                 is_fraudulent = True
                 verification_required = True
                 risk_score += 20
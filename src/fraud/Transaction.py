@@ -1,8 +1,13 @@
 from datetime import datetime
 
 class Transaction:
-    """Representa uma única transação financeira."""
-    def __init__(self, amount: float, timestamp: datetime, location: str):
+    """
+    Representa uma única transação financeira.
+
+    O timestamp pode ser um datetime ou segundos inteiros desde a época
+    (ver `src.epoch`); todas as transações de uma verificação devem usar o mesmo formato.
+    """
+    def __init__(self, amount: float, timestamp: datetime | int, location: str):
         self.amount = amount
         self.timestamp = timestamp
         self.location = location
@@ -0,0 +1,209 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.fraud.Transaction import Transaction
+from src.fuzz.FuzzReport import FuzzReport
+from src.fuzz.FuzzTarget import FuzzTarget
+from src.fuzz.Mismatch import Mismatch
+
+
+class DifferentialFuzzer:
+    """
+    Compara uma implementação candidata com a referência de um motor em entradas
+    aleatórias reproduzíveis, distribuindo os casos entre processos.
+
+    Cada bloco de casos usa seu próprio gerador semeado por (alvo, semente, bloco),
+    então os processos não trocam entradas, apenas as divergências encontradas,
+    que são reduzidas a um reprodutor mínimo antes de retornar.
+    """
+    def __init__(self, target: FuzzTarget, jobs: int | None = None, chunk_size: int = 20000):
+        self.target = target
+        self.jobs = jobs
+        self.chunk_size = chunk_size
+
+    def run(self, candidate, cases: int, seed: int = 0, max_mismatches: int = 10) -> FuzzReport:
+        """
+        Executa `cases` casos contra a candidata, que pode ser uma função com a mesma
+        assinatura do método de referência ou uma classe que o implemente.
+        """
+        start = time.perf_counter()
+        chunks = [
+            (chunk, min(self.chunk_size, cases - chunk * self.chunk_size))
+            for chunk in range(math.ceil(cases / self.chunk_size))
+        ]
+        cases_run = 0
+        mismatches: list[Mismatch] = []
+
+        if self.jobs == 1:
+            for chunk, size in chunks:
+                count, found = run_chunk(self.target, candidate, seed, chunk, size, max_mismatches - len(mismatches))
+                cases_run += count
+                mismatches.extend(found)
+                if len(mismatches) >= max_mismatches:
+                    break
+        else:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                futures = [
+                    executor.submit(run_chunk, self.target, candidate, seed, chunk, size, max_mismatches)
+                    for chunk, size in chunks
+                ]
+                for future in as_completed(futures):
+                    count, found = future.result()
+                    cases_run += count
+                    mismatches.extend(found)
+                    if len(mismatches) >= max_mismatches:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        mismatches.sort(key=lambda mismatch: (mismatch.chunk, mismatch.index))
+        return FuzzReport(self.target.name, cases_run, mismatches[:max_mismatches], time.perf_counter() - start)
+
+
+def run_chunk(target: FuzzTarget, candidate, seed: int, chunk: int, size: int, max_mismatches: int) -> tuple[int, list[Mismatch]]:
+    """Executa um bloco de casos e retorna quantos rodaram e as divergências reduzidas."""
+    rng = random.Random(f"{target.name}:{seed}:{chunk}")
+    reference = target.reference
+    candidate = target.bind(candidate)
+    generate = target.generate
+    mismatches = []
+    for index in range(size):
+        arguments = generate(rng)
+        expected = outcome(reference, arguments)
+        actual = outcome(candidate, arguments)
+        if expected != actual and not equivalent(expected, actual):
+            minimal = shrink(reference, candidate, arguments)
+            mismatches.append(Mismatch(
+                target.name, seed, chunk, index, arguments, minimal,
+                outcome(reference, minimal), outcome(candidate, minimal),
+            ))
+            if len(mismatches) >= max_mismatches:
+                return index + 1, mismatches
+    return size, mismatches
+
+
+def outcome(function: Callable, arguments: dict):
+    """Normaliza o retorno (ou a exceção) de uma chamada em uma estrutura comparável."""
+    try:
+        result = function(**arguments)
+    except Exception as error:
+        return ("raised", type(error).__name__)
+    if hasattr(result, "_asdict"):
+        return result._asdict()
+    return vars(result)
+
+
+def equivalent(expected, actual) -> bool:
+    """Compara resultados tolerando diferenças de arredondamento em floats."""
+    if isinstance(expected, float) or isinstance(actual, float):
+        return (isinstance(expected, (int, float)) and isinstance(actual, (int, float))
+                and math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9))
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        return expected.keys() == actual.keys() and all(equivalent(expected[k], actual[k]) for k in expected)
+    if isinstance(expected, (list, tuple)) and isinstance(actual, (list, tuple)):
+        return len(expected) == len(actual) and all(map(equivalent, expected, actual))
+    return expected == actual
+
+
+def _size(number) -> tuple[int, float]:
+    """Mede a complexidade de um número: dígitos significativos e, depois, magnitude."""
+    text = repr(abs(number))
+    text = text.rstrip("0")
+    text = text.rstrip(".")
+    text = text.replace(".", "")
+    digits = text.lstrip("0")
+    return len(digits), abs(number)
+
+
+def _simpler_numbers(value) -> list:
+    """
+    Propõe zero, arredondamentos para potências de dez (que levam os valores às
+    bordas redondas das regras, como 10000), truncamento, metade e um passo em
+    direção a zero, mantendo só os que têm tamanho estritamente menor.
+    """
+    magnitude = len(str(int(abs(value))))
+    candidates = [0 if isinstance(value, int) else 0.0]
+    candidates += [round(value, -places) for places in range(magnitude, -1, -1)]
+    if isinstance(value, int):
+        candidates += [value // 2, value - 1 if value > 0 else value + 1]
+    else:
+        candidates += [float(math.trunc(value)), value / 2]
+    simpler = []
+    for candidate in candidates:
+        if _size(candidate) < _size(value) and candidate not in simpler:
+            simpler.append(candidate)
+    return simpler
+
+
+def simplifications(value) -> list:
+    """Lista versões mais simples de um argumento, da mais agressiva para a mais branda."""
+    if isinstance(value, bool):
+        return [False] if value else []
+    if isinstance(value, (int, float)):
+        return _simpler_numbers(value)
+    if isinstance(value, str):
+        return [""] if value else []
+    if isinstance(value, datetime):
+        truncated = (
+            value.replace(minute=0, second=0, microsecond=0),
+            value.replace(second=0, microsecond=0),
+            value.replace(microsecond=0),
+        )
+        return [candidate for candidate in dict.fromkeys(truncated) if candidate != value]
+    if isinstance(value, Transaction):
+        return (
+            [Transaction(amount, value.timestamp, value.location) for amount in simplifications(value.amount)]
+            + [Transaction(value.amount, timestamp, value.location) for timestamp in simplifications(value.timestamp)]
+            + [Transaction(value.amount, value.timestamp, location) for location in simplifications(value.location)]
+        )
+    if isinstance(value, DeviceSchedule):
+        return (
+            [DeviceSchedule(name, value.scheduled_time) for name in simplifications(value.device_name)]
+            + [DeviceSchedule(value.device_name, moment) for moment in simplifications(value.scheduled_time)]
+        )
+    if isinstance(value, list):
+        if not value:
+            return []
+        half = len(value) // 2
+        smaller = [[], value[:half], value[half:]]
+        smaller += [value[:i] + value[i + 1:] for i in range(len(value))]
+        smaller = [candidate for candidate in smaller if len(candidate) < len(value)]
+        return smaller + [
+            value[:i] + [simpler] + value[i + 1:]
+            for i, item in enumerate(value) for simpler in simplifications(item)
+        ]
+    if isinstance(value, dict):
+        return [{k: v for k, v in value.items() if k != key} for key in value] + [
+            {**value, key: simpler} for key, item in value.items() for simpler in simplifications(item)
+        ]
+    return []
+
+
+def shrink(reference: Callable, candidate: Callable, arguments: dict, max_steps: int = 5000) -> dict:
+    """
+    Reduz gulosamente os argumentos de uma divergência, aceitando cada
+    simplificação que ainda faz a referência e a candidata discordarem.
+    """
+    def still_fails(trial: dict) -> bool:
+        return not equivalent(outcome(reference, trial), outcome(candidate, trial))
+
+    current = dict(arguments)
+    steps = 0
+    improved = True
+    while improved and steps < max_steps:
+        improved = False
+        for key, value in current.items():
+            for simpler in simplifications(value):
+                steps += 1
+                trial = {**current, key: simpler}
+                if still_fails(trial):
+                    current = trial
+                    improved = True
+                    break
+            if improved or steps >= max_steps:
+                break
+    return current
@@ -0,0 +1,20 @@
+from src.fuzz.Mismatch import Mismatch
+
+
+class FuzzReport:
+    """Armazena o resultado de uma execução de testes diferenciais."""
+    def __init__(self, target: str, cases_run: int, mismatches: list[Mismatch], elapsed_seconds: float):
+        self.target = target
+        self.cases_run = cases_run
+        self.mismatches = mismatches
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def cases_per_second(self) -> float:
+        return self.cases_run / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"FuzzReport(target='{self.target}', cases_run={self.cases_run}, "
+                f"mismatches={len(self.mismatches)}, "
+                f"cases_per_second={self.cases_per_second:.0f})")
@@ -0,0 +1,28 @@
+import random
+from typing import Callable
+
+
+class FuzzTarget:
+    """
+    Descreve um motor a ser comparado: a classe de referência, o método avaliado
+    e um gerador de argumentos nomeados a partir de um `random.Random`.
+    """
+    def __init__(self, name: str, reference_class: type, method_name: str, generate: Callable[[random.Random], dict]):
+        self.name = name
+        self.reference_class = reference_class
+        self.method_name = method_name
+        self.generate = generate
+
+    def bind(self, implementation) -> Callable:
+        """Retorna o método avaliado de uma classe, ou a própria função se não for uma classe."""
+        if isinstance(implementation, type):
+            return getattr(implementation(), self.method_name)
+        return implementation
+
+    @property
+    def reference(self) -> Callable:
+        return self.bind(self.reference_class)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"FuzzTarget(name='{self.name}', reference={self.reference_class.__name__}.{self.method_name})"
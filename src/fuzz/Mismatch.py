@@ -0,0 +1,17 @@
+class Mismatch:
+    """Armazena uma divergência entre a referência e a implementação candidata."""
+    def __init__(self, target: str, seed: int, chunk: int, index: int, arguments: dict, minimal_arguments: dict, expected, actual):
+        self.target = target
+        self.seed = seed
+        self.chunk = chunk
+        self.index = index
+        self.arguments = arguments
+        self.minimal_arguments = minimal_arguments
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"Mismatch(target='{self.target}', seed={self.seed}, chunk={self.chunk}, index={self.index}, "
+                f"minimal_arguments={self.minimal_arguments}, "
+                f"expected={self.expected}, actual={self.actual})")
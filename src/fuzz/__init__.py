@@ -0,0 +1,6 @@
+from .DifferentialFuzzer import DifferentialFuzzer
+from .FuzzReport import FuzzReport
+from .FuzzTarget import FuzzTarget
+from .Mismatch import Mismatch
+from .targets import TARGETS
+__all__ = ["DifferentialFuzzer", "FuzzReport", "FuzzTarget", "Mismatch", "TARGETS"]
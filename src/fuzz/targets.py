@@ -0,0 +1,99 @@
+import random
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.epoch import to_epoch_seconds
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.Transaction import Transaction
+from src.fuzz.FuzzTarget import FuzzTarget
+
+BASE_TIME = datetime(2025, 10, 12, 0, 0, 0)
+BASE_EPOCH = to_epoch_seconds(BASE_TIME)
+DAY = 24 * 3600
+
+# Valores nas bordas das regras de cada motor (em segundos quando são intervalos)
+FRAUD_WINDOW_OFFSETS = (0, 1, 1799, 1800, 1801, 3599, 3600, 3601)
+FRAUD_AMOUNTS = (0, 9999.99, 10000, 10000.01, 10001)
+FLIGHT_DEPARTURE_OFFSETS = (0, DAY - 1, DAY, DAY + 1, 2 * DAY - 1, 2 * DAY, 2 * DAY + 1)
+ENERGY_HOURS = (0, 5, 6, 7, 22, 23)
+LOCATIONS = ("New York", "Los Angeles", "Las Vegas", "Miami")
+DEVICES = ("Security", "Refrigerator", "Lights", "TV", "Heating", "Cooling", "Oven")
+
+
+def _moment(seconds: int, epoch_mode: bool):
+    """Representa o instante BASE + seconds como inteiro ou datetime."""
+    if epoch_mode:
+        return BASE_EPOCH + seconds
+    return BASE_TIME + timedelta(seconds=seconds)
+
+
+def _pick(rng: random.Random, boundaries: tuple, upper: int):
+    """Escolhe um valor de borda na metade das vezes e um valor aleatório na outra metade."""
+    if rng.random() < 0.5:
+        return rng.choice(boundaries)
+    return rng.randrange(upper)
+
+
+def generate_fraud_case(rng: random.Random) -> dict:
+    epoch_mode = rng.random() < 0.5
+    now = rng.randrange(2 * DAY, 3 * DAY)
+    offsets = sorted((_pick(rng, FRAUD_WINDOW_OFFSETS, 7200) for _ in range(rng.randrange(16))), reverse=True)
+    return {
+        "current_transaction": Transaction(
+            rng.choice(FRAUD_AMOUNTS) if rng.random() < 0.5 else rng.uniform(0, 20000),
+            _moment(now, epoch_mode),
+            rng.choice(LOCATIONS),
+        ),
+        "previous_transactions": [
+            Transaction(rng.uniform(0, 20000), _moment(now - offset, epoch_mode), rng.choice(LOCATIONS))
+            for offset in offsets
+        ],
+        "blacklisted_locations": rng.sample(LOCATIONS, rng.randrange(3)),
+    }
+
+
+def generate_flight_case(rng: random.Random) -> dict:
+    epoch_mode = rng.random() < 0.5
+    booking = rng.randrange(DAY)
+    available_seats = rng.randrange(10)
+    return {
+        "passengers": max(0, available_seats + rng.choice((-1, 0, 1))) if rng.random() < 0.5 else rng.choice((1, 4, 5, 6)),
+        "booking_time": _moment(booking, epoch_mode),
+        "available_seats": available_seats,
+        "current_price": rng.choice((0.0, 100.0, 500.0)) if rng.random() < 0.5 else rng.uniform(0, 2000),
+        "previous_sales": rng.randrange(200),
+        "is_cancellation": rng.random() < 0.5,
+        "departure_time": _moment(booking + _pick(rng, FLIGHT_DEPARTURE_OFFSETS, 4 * DAY), epoch_mode),
+        "reward_points_available": rng.choice((0, 1, 1000, 100000)),
+    }
+
+
+def generate_energy_case(rng: random.Random) -> dict:
+    epoch_mode = rng.random() < 0.5
+    seconds = _pick(rng, tuple(hour * 3600 + delta for hour in ENERGY_HOURS for delta in (0, 3599)), DAY)
+    price_threshold = rng.choice((0.10, 0.20))
+    low, high = 20.0, 24.0
+    energy_usage_limit = rng.randrange(5, 40)
+    devices = rng.sample(DEVICES, rng.randrange(1, len(DEVICES) + 1))
+    return {
+        "current_price": rng.choice((price_threshold - 0.01, price_threshold, price_threshold + 0.01)),
+        "price_threshold": price_threshold,
+        "device_priorities": {device: rng.randrange(1, 4) for device in devices},
+        "current_time": _moment(seconds, epoch_mode),
+        "current_temperature": rng.choice((low - 0.5, low, (low + high) / 2, high, high + 0.5)),
+        "desired_temperature_range": (low, high),
+        "energy_usage_limit": energy_usage_limit,
+        "total_energy_used_today": energy_usage_limit + rng.choice((-5, -1, 0, 1, 5)),
+        "scheduled_devices": [
+            DeviceSchedule(rng.choice(DEVICES), _moment(seconds + rng.choice((-1, 0, 0, 1)), epoch_mode))
+            for _ in range(rng.randrange(3))
+        ],
+    }
+
+
+TARGETS = {
+    "fraud": FuzzTarget("fraud", FraudDetectionSystem, "check_for_fraud", generate_fraud_case),
+    "flight": FuzzTarget("flight", FlightBookingSystem, "book_flight", generate_flight_case),
+    "energy": FuzzTarget("energy", SmartEnergyManagementSystem, "manage_energy", generate_energy_case),
+}
@@ -0,0 +1,131 @@
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DayAheadPlanner import DayAheadPlanner
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+START = datetime(2025, 10, 12, 0, 0, 0)
+
+
+@pytest.fixture
+def base_setup():
+    return DayAheadPlanner(), {
+        "Security": 1,
+        "Refrigerator": 1,
+        "Lights": 2,
+        "TV": 3,
+    }, {
+        "Security": 0.1,
+        "Refrigerator": 0.5,
+        "Lights": 1.0,
+        "TV": 1.0,
+    }
+
+
+# -------------------------------------------------------------
+# P1 — Orçamento folgado: todos os dispositivos fora do modo noturno
+# -------------------------------------------------------------
+def test_P1_unlimited_budget(base_setup):
+    planner, devices, consumption = base_setup
+    plan = planner.plan(START, [0.10] * 24, devices, consumption, 1000, 0, [])
+    assert len(plan.hourly_status) == 24
+    for slot, status in enumerate(plan.hourly_status):
+        night = slot >= 23 or slot < 6
+        assert status["Security"] and status["Refrigerator"]
+        assert status["Lights"] == (not night)
+        assert status["TV"] == (not night)
+    assert plan.planned_energy == pytest.approx(24 * 0.6 + 17 * 2.0)
+
+
+# -------------------------------------------------------------
+# P2 — Orçamento curto: prioridade primeiro, depois horas mais baratas
+# -------------------------------------------------------------
+def test_P2_budget_prefers_priority_then_cheap_hours(base_setup):
+    planner, devices, consumption = base_setup
+    prices = [0.30] * 24
+    prices[10] = 0.05
+    prices[14] = 0.10
+    plan = planner.plan(START, prices, devices, consumption, 24 * 0.6 + 2.0, 0, [])
+    lights_on = [slot for slot, status in enumerate(plan.hourly_status) if status["Lights"]]
+    tv_on = [slot for slot, status in enumerate(plan.hourly_status) if status["TV"]]
+    assert lights_on == [10, 14]
+    assert tv_on == []
+    assert plan.planned_energy <= 24 * 0.6 + 2.0
+
+
+# -------------------------------------------------------------
+# P3 — Horas acima do preço limite não recebem dispositivos opcionais
+# -------------------------------------------------------------
+def test_P3_price_threshold_excludes_expensive_hours(base_setup):
+    planner, devices, consumption = base_setup
+    prices = [0.10] * 24
+    prices[12] = 0.50
+    plan = planner.plan(START, prices, devices, consumption, 1000, 0, [], price_threshold=0.20)
+    assert not plan.hourly_status[12]["Lights"]
+    assert plan.hourly_status[12]["Refrigerator"]
+    assert plan.hourly_status[13]["Lights"]
+
+
+# -------------------------------------------------------------
+# P4 — Agendamentos são atendidos mesmo sem orçamento e no modo noturno
+# -------------------------------------------------------------
+def test_P4_schedule_always_honoured(base_setup):
+    planner, devices, consumption = base_setup
+    schedule = [DeviceSchedule("TV", START + timedelta(hours=2))]
+    plan = planner.plan(START, [0.10] * 24, devices, consumption, 0, 0, schedule)
+    assert plan.hourly_status[2]["TV"]
+    assert not any(status["Lights"] for status in plan.hourly_status)
+
+
+# -------------------------------------------------------------
+# P5 — manage_energy segue o plano e volta à regra de preço fora dele
+# -------------------------------------------------------------
+def test_P5_manage_energy_follows_plan(base_setup):
+    planner, devices, consumption = base_setup
+    prices = [0.30] * 24
+    prices[10] = 0.05
+    plan = planner.plan(START, prices, devices, consumption, 24 * 0.6 + 1.0, 0, [])
+    system = SmartEnergyManagementSystem()
+
+    result = system.manage_energy(
+        0.30, 0.20, devices, START + timedelta(hours=10, minutes=30),
+        22.0, (20.0, 24.0), 30, 10, [], plan=plan
+    )
+    assert result.energy_saving_mode
+    assert result.device_status["Lights"]
+    assert not result.device_status["TV"]
+
+    result = system.manage_energy(
+        0.30, 0.20, devices, START + timedelta(hours=11),
+        22.0, (20.0, 24.0), 30, 10, [], plan=plan
+    )
+    assert not result.device_status["Lights"]
+
+    assert plan.status_at(START + timedelta(days=1)) is None
+    assert plan.status_at(START - timedelta(minutes=1)) is None
+
+
+# -------------------------------------------------------------
+# P6 — Dispositivo sem consumo informado gera erro
+# -------------------------------------------------------------
+def test_P6_missing_consumption_raises(base_setup):
+    planner, devices, consumption = base_setup
+    del consumption["TV"]
+    with pytest.raises(ValueError, match="TV"):
+        planner.plan(START, [0.10] * 24, devices, consumption, 1000, 0, [])
+    schedule = [DeviceSchedule("Oven", START + timedelta(hours=12))]
+    consumption["TV"] = 1.0
+    with pytest.raises(ValueError, match="Oven"):
+        planner.plan(START, [0.10] * 24, devices, consumption, 1000, 0, schedule)
+
+
+# -------------------------------------------------------------
+# P7 — Dispositivos sem consumo são ligados mesmo sem orçamento
+# -------------------------------------------------------------
+def test_P7_zero_cost_devices_with_exhausted_budget(base_setup):
+    planner, devices, consumption = base_setup
+    consumption["TV"] = 0.0
+    plan = planner.plan(START, [0.10] * 24, devices, consumption, 0, 0, [])
+    assert plan.hourly_status[12]["TV"]
+    assert not plan.hourly_status[2]["TV"]
+    assert not any(status["Lights"] for status in plan.hourly_status)
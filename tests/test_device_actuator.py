@@ -0,0 +1,176 @@
+import asyncio
+import pytest
+from src.energy.DeviceActuator import DeviceActuator
+from src.energy.DeviceGateway import DeviceGateway, FakeDeviceGateway
+from src.energy.EnergyManagementResult import EnergyManagementResult
+
+
+def make_result(device_status):
+    return EnergyManagementResult(device_status, False, False, 0.0)
+
+
+# A1 — Primeiro envio manda todos os dispositivos
+def test_first_apply_sends_everything():
+    gateway = FakeDeviceGateway()
+    actuator = DeviceActuator(gateway)
+    status = {"Lights": True, "TV": False, "Heating": True}
+    sent = asyncio.run(actuator.apply("home-1", make_result(status)))
+    assert sent == status
+    assert gateway.device_state["home-1"] == status
+
+
+# A2 — Reenvio idêntico não gera comandos; mudanças enviam apenas o delta
+def test_only_changed_devices_are_sent():
+    gateway = FakeDeviceGateway()
+    actuator = DeviceActuator(gateway)
+
+    async def scenario():
+        await actuator.apply("home-1", make_result({"Lights": True, "TV": False}))
+        unchanged = await actuator.apply("home-1", make_result({"Lights": True, "TV": False}))
+        changed = await actuator.apply("home-1", make_result({"Lights": True, "TV": True}))
+        return unchanged, changed
+
+    unchanged, changed = asyncio.run(scenario())
+    assert unchanged == {}
+    assert changed == {"TV": True}
+    assert gateway.sent_batches[-1] == ("home-1", {"TV": True})
+    assert len(gateway.sent_batches) == 2
+
+
+# A3 — Mudanças são divididas em lotes de tamanho máximo
+def test_changes_are_batched():
+    gateway = FakeDeviceGateway()
+    actuator = DeviceActuator(gateway, batch_size=2)
+    status = {f"Device{i}": True for i in range(5)}
+    asyncio.run(actuator.apply("home-1", make_result(status)))
+    assert [len(batch) for _, batch in gateway.sent_batches] == [2, 2, 1]
+    assert gateway.device_state["home-1"] == status
+
+
+# A4 — Falhas transitórias são repetidas com uma nova conexão
+def test_transient_failures_are_retried():
+    gateway = FakeDeviceGateway(failures=2)
+    actuator = DeviceActuator(gateway, max_retries=3, retry_delay=0)
+    asyncio.run(actuator.apply("home-1", make_result({"Lights": True})))
+    assert gateway.device_state["home-1"] == {"Lights": True}
+    assert gateway.connections_closed == 2
+
+
+# A5 — Falha persistente propaga o erro e não marca o estado como aplicado
+def test_persistent_failure_keeps_state_pending():
+    gateway = FakeDeviceGateway(failures=10)
+    actuator = DeviceActuator(gateway, max_retries=1, retry_delay=0)
+    with pytest.raises(ConnectionError):
+        asyncio.run(actuator.apply("home-1", make_result({"Lights": True})))
+    assert actuator.diff("home-1", make_result({"Lights": True})) == {"Lights": True}
+
+
+# A6 — Várias residências compartilham um pool limitado de conexões
+def test_apply_many_reuses_pooled_connections():
+    gateway = FakeDeviceGateway(latency=0.001)
+    actuator = DeviceActuator(gateway, max_connections=3)
+    results = {f"home-{i}": make_result({"Lights": i % 2 == 0}) for i in range(20)}
+
+    async def scenario():
+        sent = await actuator.apply_many(results)
+        await actuator.close()
+        return sent
+
+    outcome = asyncio.run(scenario())
+    assert outcome.sent["home-4"] == {"Lights": True}
+    assert outcome.failures == {}
+    assert len(gateway.device_state) == 20
+    assert gateway.connections_opened <= 3
+    assert gateway.connections_closed == gateway.connections_opened
+
+
+# A7 — O limite de envios por segundo espaça os lotes
+def test_rate_limit_spaces_sends():
+    gateway = FakeDeviceGateway()
+    actuator = DeviceActuator(gateway, batch_size=1, max_sends_per_second=100)
+    status = {f"Device{i}": True for i in range(5)}
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await actuator.apply("home-1", make_result(status))
+        return loop.time() - start
+
+    assert asyncio.run(scenario()) >= 0.035
+
+
+# A8 — A falha definitiva de uma residência não esconde o resultado das demais
+def test_apply_many_reports_per_home_failures():
+    class FailingHomeGateway(FakeDeviceGateway):
+        async def connect(self):
+            connection = await super().connect()
+            send = connection.send
+
+            async def send_or_fail(home_id, commands):
+                if home_id == "home-bad":
+                    raise ConnectionError("residência inacessível")
+                await send(home_id, commands)
+
+            connection.send = send_or_fail
+            return connection
+
+    gateway = FailingHomeGateway()
+    actuator = DeviceActuator(gateway, max_retries=1, retry_delay=0)
+    results = {home: make_result({"Lights": True}) for home in ("home-1", "home-bad", "home-2")}
+    outcome = asyncio.run(actuator.apply_many(results))
+    assert outcome.sent == {"home-1": {"Lights": True}, "home-2": {"Lights": True}}
+    assert list(outcome.failures) == ["home-bad"]
+    assert isinstance(outcome.failures["home-bad"], ConnectionError)
+    assert "home-bad" not in gateway.device_state
+
+
+# A9 — Gateways incompletos falham na criação
+def test_incomplete_gateway_cannot_be_instantiated():
+    class IncompleteGateway(DeviceGateway):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteGateway()
+
+
+# A10 — Envio cancelado devolve a vaga ao pool
+def test_cancelled_send_releases_pool_slot():
+    gateway = FakeDeviceGateway(latency=1.0)
+    actuator = DeviceActuator(gateway, max_connections=1)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(actuator.apply("home-1", make_result({"Lights": True})), 0.01)
+        gateway.latency = 0.0
+        return await asyncio.wait_for(actuator.apply("home-2", make_result({"TV": True})), 1.0)
+
+    assert asyncio.run(scenario()) == {"TV": True}
+    assert gateway.connections_closed == 1
+
+
+# A11 — Erros não transitórios não são repetidos e não esgotam o pool
+def test_non_transient_errors_release_pool_slot():
+    class RejectingGateway(FakeDeviceGateway):
+        async def connect(self):
+            connection = await super().connect()
+            send = connection.send
+
+            async def send_or_reject(home_id, commands):
+                if home_id.startswith("bad"):
+                    raise ValueError("comando inválido")
+                await send(home_id, commands)
+
+            connection.send = send_or_reject
+            return connection
+
+    gateway = RejectingGateway()
+    actuator = DeviceActuator(gateway, max_connections=2, retry_delay=0)
+
+    async def scenario():
+        for home_id in ("bad-1", "bad-2"):
+            with pytest.raises(ValueError):
+                await actuator.apply(home_id, make_result({"Lights": True}))
+        return await asyncio.wait_for(actuator.apply("home-1", make_result({"Lights": True})), 1.0)
+
+    assert asyncio.run(scenario()) == {"Lights": True}
+    assert gateway.connections_opened == 3
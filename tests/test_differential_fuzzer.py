@@ -0,0 +1,109 @@
+import pytest
+from datetime import datetime, timedelta
+from src.flight import FlightBookingSystem
+from src.fraud import FraudDetectionSystem, Transaction
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.fuzz import DifferentialFuzzer, TARGETS
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.fuzz.DifferentialFuzzer import equivalent, shrink, simplifications
+
+
+def blacklist_ignored_without_history(current_transaction, previous_transactions, blacklisted_locations):
+    if not previous_transactions:
+        blacklisted_locations = []
+    return FraudDetectionSystem().check_for_fraud(current_transaction, previous_transactions, blacklisted_locations)
+
+
+def departure_one_second_later(**arguments):
+    departure_time = arguments["departure_time"]
+    one_second = 1 if isinstance(departure_time, int) else timedelta(seconds=1)
+    arguments["departure_time"] = departure_time + one_second
+    return FlightBookingSystem().book_flight(**arguments)
+
+
+class NightModeFromMidnight(SmartEnergyManagementSystem):
+    def manage_energy(self, *args, **arguments):
+        current_time = arguments["current_time"]
+        hour = current_time // 3600 % 24 if isinstance(current_time, int) else current_time.hour
+        if hour == 23:
+            arguments["current_time"] = current_time - (3600 if isinstance(current_time, int) else timedelta(hours=1))
+        return super().manage_energy(*args, **arguments)
+
+
+# D1 — A referência comparada consigo mesma não gera divergências
+@pytest.mark.parametrize("name", sorted(TARGETS))
+def test_reference_matches_itself(name):
+    target = TARGETS[name]
+    report = DifferentialFuzzer(target, jobs=1, chunk_size=500).run(target.reference_class, 2000, seed=1)
+    assert report.cases_run == 2000
+    assert report.mismatches == []
+
+
+# D2 — Divergência é encontrada e reduzida a um reprodutor mínimo
+def test_mismatch_is_shrunk():
+    report = DifferentialFuzzer(TARGETS["fraud"], jobs=1).run(blacklist_ignored_without_history, 5000, max_mismatches=1)
+    assert len(report.mismatches) == 1
+    minimal = report.mismatches[0].minimal_arguments
+    assert minimal["previous_transactions"] == []
+    assert minimal["blacklisted_locations"] == [minimal["current_transaction"].location]
+    assert minimal["current_transaction"].amount == 0
+    assert report.mismatches[0].expected["risk_score"] == 100
+
+
+# D3 — Bordas de 24h/48h são exercitadas pelo gerador
+def test_boundary_mismatch_found():
+    report = DifferentialFuzzer(TARGETS["flight"], jobs=1).run(departure_one_second_later, 5000, max_mismatches=3)
+    assert report.mismatches
+    assert all(not equivalent(m.expected, m.actual) for m in report.mismatches)
+
+
+# D4 — Execução em processos encontra as mesmas divergências, com classes candidatas
+def test_parallel_run_with_candidate_class():
+    sequential = DifferentialFuzzer(TARGETS["energy"], jobs=1, chunk_size=1000).run(NightModeFromMidnight, 3000, seed=7, max_mismatches=100)
+    parallel = DifferentialFuzzer(TARGETS["energy"], jobs=2, chunk_size=1000).run(NightModeFromMidnight, 3000, seed=7, max_mismatches=100)
+    assert sequential.mismatches
+    assert [(m.chunk, m.index) for m in parallel.mismatches] == [(m.chunk, m.index) for m in sequential.mismatches]
+
+
+# D5 — Exceções da candidata também contam como divergência
+def test_exception_is_a_mismatch():
+    def always_raises(**arguments):
+        raise RuntimeError("boom")
+
+    report = DifferentialFuzzer(TARGETS["flight"], jobs=1).run(always_raises, 10, max_mismatches=1)
+    mismatch = report.mismatches[0]
+    assert mismatch.actual == ("raised", "RuntimeError")
+    assert mismatch.minimal_arguments["passengers"] == 0
+    assert mismatch.minimal_arguments["is_cancellation"] is False
+
+
+# D6 — Objetos de domínio e datetimes também são simplificados
+def test_simplifications_of_domain_objects():
+    assert simplifications(9999.99) == [0.0, 10000.0, 9999.0]
+    assert simplifications(datetime(2025, 10, 12, 10, 30, 15)) == [
+        datetime(2025, 10, 12, 10, 0), datetime(2025, 10, 12, 10, 30),
+    ]
+    transaction = Transaction(12345.5, datetime(2025, 10, 12, 10, 30), "Miami")
+    amounts = [t.amount for t in simplifications(transaction) if t.location == "Miami"]
+    assert 10000.0 in amounts
+    assert any(t.location == "" for t in simplifications(transaction))
+    schedule = DeviceSchedule("TV", datetime(2025, 10, 12, 18, 5))
+    assert any(s.scheduled_time == datetime(2025, 10, 12, 18) for s in simplifications(schedule))
+
+
+# D7 — Valores dentro de transações são reduzidos até a borda da regra
+def test_transaction_amount_shrinks_to_boundary():
+    def strict_amount_rule(current_transaction, previous_transactions, blacklisted_locations):
+        result = FraudDetectionSystem().check_for_fraud(current_transaction, previous_transactions, blacklisted_locations)
+        if current_transaction.amount >= 10000:
+            result.risk_score += 1
+        return result
+
+    arguments = {
+        "current_transaction": Transaction(17345.67, datetime(2025, 10, 12, 10, 31, 7), "Miami"),
+        "previous_transactions": [],
+        "blacklisted_locations": [],
+    }
+    minimal = shrink(FraudDetectionSystem().check_for_fraud, strict_amount_rule, arguments)
+    assert minimal["current_transaction"].amount == 10000.0
+    assert minimal["current_transaction"].timestamp == datetime(2025, 10, 12, 10, 0)
@@ -0,0 +1,134 @@
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.epoch import to_epoch_seconds, from_epoch_seconds
+from src.fraud import FraudDetectionSystem, Transaction
+from src.flight import FlightBookingSystem
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.DeviceSchedule import DeviceSchedule
+
+BASE = datetime(2025, 10, 12, 0, 0, 0)
+
+
+def random_moment(rng):
+    return BASE + timedelta(seconds=rng.randrange(3 * 24 * 3600))
+
+
+def epoch_or_rejected(moments):
+    """Converte os instantes ou, se algum tiver frações de segundo, confirma que a conversão é rejeitada."""
+    if any(moment.microsecond for moment in moments):
+        for moment in moments:
+            if moment.microsecond:
+                with pytest.raises(ValueError):
+                    to_epoch_seconds(moment)
+        return None
+    return [to_epoch_seconds(moment) for moment in moments]
+
+
+# E1 — Conversões de ida e volta preservam o horário de parede
+def test_round_trip_conversion():
+    moment = datetime(2025, 10, 12, 23, 30, 15)
+    seconds = to_epoch_seconds(moment)
+    assert from_epoch_seconds(seconds) == moment
+    assert seconds // 3600 % 24 == 23
+    assert to_epoch_seconds(datetime(1970, 1, 1, 1)) == 3600
+
+
+# E1b — Datetimes com fuso são rejeitados para não mudar a hora local
+def test_aware_datetime_is_rejected():
+    utc_minus_3 = timezone(timedelta(hours=-3))
+    with pytest.raises(ValueError):
+        to_epoch_seconds(datetime(2025, 10, 12, 20, 0, 0, tzinfo=utc_minus_3))
+    with pytest.raises(ValueError):
+        to_epoch_seconds(datetime(2025, 10, 12, 20, 0, 0, tzinfo=timezone.utc))
+
+
+# E1c — Frações de segundo são rejeitadas para não mudar as bordas das regras
+def test_sub_second_datetime_is_rejected():
+    with pytest.raises(ValueError):
+        to_epoch_seconds(datetime(2025, 10, 12, 20, 0, 0, 600000))
+
+
+# E2 — Detecção de fraude: mesmo resultado nos dois modos, inclusive nas bordas
+@pytest.mark.parametrize("seed", range(5))
+def test_fraud_equivalence(seed):
+    rng = random.Random(seed)
+    system = FraudDetectionSystem()
+    for _ in range(200):
+        now = random_moment(rng) + timedelta(microseconds=rng.choice([0, 0, 600000]))
+        offsets = sorted(
+            (rng.choice([rng.randrange(7200), 1800, 1799, 1799.6, 3600, 3599.6, 3601]) for _ in range(rng.randrange(15))),
+            reverse=True,
+        )
+        locations = ["A", "B", "C"]
+        previous = [(now - timedelta(seconds=o), rng.choice(locations)) for o in offsets]
+        current = (now, rng.choice(locations))
+        amount = rng.choice([100, 10000, 10001])
+        blacklist = [rng.choice(locations)] if rng.random() < 0.2 else []
+
+        by_datetime = system.check_for_fraud(
+            Transaction(amount, current[0], current[1]),
+            [Transaction(50, t, loc) for t, loc in previous],
+            blacklist,
+        )
+        epochs = epoch_or_rejected([current[0]] + [t for t, _ in previous])
+        if epochs is None:
+            continue
+        by_epoch = system.check_for_fraud(
+            Transaction(amount, epochs[0], current[1]),
+            [Transaction(50, t, loc) for t, (_, loc) in zip(epochs[1:], previous)],
+            blacklist,
+        )
+        assert by_epoch._asdict() == by_datetime._asdict()
+
+
+# E3 — Reserva de voos: mesmo resultado nos dois modos, inclusive em 24h e 48h
+@pytest.mark.parametrize("seed", range(5))
+def test_flight_equivalence(seed):
+    rng = random.Random(seed)
+    system = FlightBookingSystem()
+    for _ in range(200):
+        booking = random_moment(rng) + timedelta(microseconds=rng.choice([0, 0, 400000]))
+        seconds = rng.choice([rng.randrange(4 * 24 * 3600), 86399, 86399.6, 86400, 172799, 172799.6, 172800])
+        departure = booking + timedelta(seconds=seconds)
+        args = dict(
+            passengers=rng.randrange(1, 8),
+            available_seats=rng.randrange(10),
+            current_price=rng.choice([100.0, 500.0]),
+            previous_sales=rng.randrange(200),
+            is_cancellation=rng.random() < 0.5,
+            reward_points_available=rng.choice([0, 1000, 100000]),
+        )
+        by_datetime = system.book_flight(booking_time=booking, departure_time=departure, **args)
+        epochs = epoch_or_rejected([booking, departure])
+        if epochs is None:
+            continue
+        by_epoch = system.book_flight(booking_time=epochs[0], departure_time=epochs[1], **args)
+        assert by_epoch._asdict() == by_datetime._asdict()
+
+
+# E4 — Gerenciamento de energia: mesmo resultado nos dois modos, inclusive 23h e 6h
+@pytest.mark.parametrize("seed", range(5))
+def test_energy_equivalence(seed):
+    rng = random.Random(seed)
+    system = SmartEnergyManagementSystem()
+    devices = {"Security": 1, "Refrigerator": 1, "Lights": 2, "TV": 3, "Heating": 1, "Cooling": 1}
+    for _ in range(200):
+        now = BASE + timedelta(hours=rng.choice([5, 6, 22, 23, rng.randrange(24)]), seconds=rng.choice([0, 59, 3599]))
+        schedule_times = [now, now + timedelta(minutes=1)]
+        schedules = [(rng.choice(list(devices)), rng.choice(schedule_times)) for _ in range(2)]
+        args = (
+            rng.choice([0.10, 0.30]), 0.20, devices,
+        )
+        tail = (
+            rng.choice([18.0, 22.0, 26.0]), (20.0, 24.0),
+            30, rng.choice([10, 30, 35]),
+        )
+        by_datetime = system.manage_energy(
+            *args, now, *tail, [DeviceSchedule(d, t) for d, t in schedules]
+        )
+        by_epoch = system.manage_energy(
+            *args, to_epoch_seconds(now), *tail,
+            [DeviceSchedule(d, to_epoch_seconds(t)) for d, t in schedules],
+        )
+        assert vars(by_epoch) == vars(by_datetime)
@@ -0,0 +1,140 @@
+import json
+import textwrap
+import pytest
+from pathlib import Path
+from generate_graph import CACHE_FILE, find_modules, function_metrics, generate, module_name
+
+MODULE_SOURCE = textwrap.dedent("""
+    def straight(x):
+        return x + 1
+
+
+    def two_returns(x):
+        if x > 0:
+            return 1
+        return 2
+
+
+    def loop_with_branch(items):
+        total = 0
+        for item in items:
+            if item:
+                total += 1
+        return total
+
+
+    class Holder:
+        def method(self, x):
+            if x:
+                return x
+            elif x is None:
+                return 0
+            return -1
+""")
+
+
+def build_metrics(source: str) -> dict:
+    staticfg = pytest.importorskip("staticfg")
+    return function_metrics(staticfg.CFGBuilder().build_from_src("module", source))
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    (tmp_path / "pyproject.toml").write_text("")
+    package = tmp_path / "pkg"
+    (package / "sub").mkdir(parents=True)
+    (package / "__pycache__").mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "a.py").write_text(MODULE_SOURCE)
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "sub" / "b.py").write_text("def f(x):\n    return x\n")
+    (package / "__pycache__" / "a.cpython-311.py").write_text("")
+    (package / "notes.txt").write_text("")
+    return package
+
+
+# G1 — Descoberta de módulos em arquivo ou diretório
+def test_find_modules(source_tree):
+    assert find_modules(source_tree) == [
+        source_tree / "__init__.py", source_tree / "a.py",
+        source_tree / "sub" / "__init__.py", source_tree / "sub" / "b.py",
+    ]
+    assert find_modules(source_tree / "a.py") == [source_tree / "a.py"]
+
+
+# G1b — Nomes de módulos são relativos à raiz do projeto, não ao diretório analisado
+def test_module_name_is_project_relative(source_tree, monkeypatch):
+    monkeypatch.chdir(source_tree / "sub")
+    assert module_name(Path("b.py")) == "pkg.sub.b"
+    assert module_name(source_tree / "__init__.py") == "pkg.__init__"
+    assert module_name(source_tree / "sub" / "__init__.py") == "pkg.sub.__init__"
+
+
+# G2 — Complexidade ciclomática de funções conhecidas, incluindo vários returns
+def test_cfg_metrics_known_functions():
+    metrics = build_metrics(MODULE_SOURCE)
+    assert metrics["straight"]["cyclomatic_complexity"] == 1
+    assert metrics["two_returns"]["cyclomatic_complexity"] == 2
+    assert metrics["loop_with_branch"]["cyclomatic_complexity"] == 3
+    assert metrics["method"]["cyclomatic_complexity"] == 3
+    assert metrics["straight"]["nodes"] == 1
+    assert metrics["straight"]["edges"] == 0
+
+
+# G3 — Cache: acerto, falha por alteração e preservação entre execuções parciais
+def test_generate_cache_hit_miss_and_invalidation(source_tree, tmp_path, monkeypatch, capsys):
+    pytest.importorskip("staticfg")
+    monkeypatch.chdir(tmp_path)
+    source = Path("pkg")
+    output = Path("out")
+
+    metrics = generate(source, output, jobs=1, render=False)
+    assert "4 module(s) processed, 0 unchanged" in capsys.readouterr().out
+    assert metrics["pkg.a"]["two_returns"]["cyclomatic_complexity"] == 2
+    assert metrics["pkg.sub.b"]["f"]["cyclomatic_complexity"] == 1
+
+    generate(source, output, jobs=1, render=False)
+    assert "0 module(s) processed, 4 unchanged" in capsys.readouterr().out
+
+    # Execução em um único arquivo não descarta o restante do cache
+    metrics = generate(source / "sub" / "b.py", output, jobs=1, render=False)
+    assert "0 module(s) processed, 1 unchanged" in capsys.readouterr().out
+    assert set(metrics) == {"pkg.__init__", "pkg.a", "pkg.sub.__init__", "pkg.sub.b"}
+
+    # Alteração de conteúdo invalida apenas o módulo alterado
+    (source / "sub" / "b.py").write_text("def f(x):\n    if x:\n        return 1\n    return 0\n")
+    metrics = generate(source, output, jobs=1, render=False)
+    assert "1 module(s) processed, 3 unchanged" in capsys.readouterr().out
+    assert metrics["pkg.sub.b"]["f"]["cyclomatic_complexity"] == 2
+
+    # Arquivos removidos saem do cache
+    (source / "a.py").unlink()
+    metrics = generate(source, output, jobs=1, render=False)
+    assert set(metrics) == {"pkg.__init__", "pkg.sub.__init__", "pkg.sub.b"}
+    cache = json.loads((output / CACHE_FILE).read_text())
+    assert (source_tree / "sub" / "b.py").resolve().as_posix() in cache
+
+
+# G4 — Diretórios diferentes não colidem e o cache vale em outro diretório de trabalho
+def test_generate_names_are_stable_across_sources_and_cwd(source_tree, tmp_path, monkeypatch, capsys):
+    pytest.importorskip("staticfg")
+    output = (tmp_path / "out").resolve()
+
+    monkeypatch.chdir(tmp_path)
+    generate(Path("pkg/sub"), output, jobs=1, render=False)
+    metrics = generate(Path("pkg"), output, jobs=1, render=False)
+    assert "2 module(s) processed, 2 unchanged" in capsys.readouterr().out
+    assert {"pkg.__init__", "pkg.sub.__init__"} <= set(metrics)
+
+    monkeypatch.chdir(source_tree / "sub")
+    metrics = generate(Path(".."), output, jobs=1, render=False)
+    assert "0 module(s) processed, 4 unchanged" in capsys.readouterr().out
+    assert len(metrics) == 4
+
+
+# G5 — Todos os módulos do pacote src podem ser analisados pelo staticfg
+def test_all_src_modules_build():
+    staticfg = pytest.importorskip("staticfg")
+    src = Path(__file__).resolve().parent.parent / "src"
+    for path in find_modules(src):
+        staticfg.CFGBuilder().build_from_file(path.stem, str(path))
@@ -0,0 +1,79 @@
+import json
+import random
+import struct
+import pytest
+from src.codec import FRAUD_CHECK_RESULT_CODEC, BOOKING_RESULT_CODEC
+from src.flight import BookingResult
+from src.fraud import FraudCheckResult
+
+
+def random_fraud_results(rng, n):
+    return [
+        FraudCheckResult(rng.random() < 0.5, rng.random() < 0.5, rng.random() < 0.5, rng.choice([0, 20, 50, 80, 100]))
+        for _ in range(n)
+    ]
+
+
+def random_booking_results(rng, n):
+    return [
+        BookingResult(rng.random() < 0.5, rng.uniform(0, 5000), rng.uniform(0, 5000), rng.random() < 0.5)
+        for _ in range(n)
+    ]
+
+
+# C1 — Resultados usam __slots__ e não possuem __dict__
+def test_results_have_slots():
+    assert not hasattr(FraudCheckResult(False, False, False, 0), "__dict__")
+    assert not hasattr(BookingResult(True, 10.0, 0.0, False), "__dict__")
+
+
+# C2 — Ida e volta de um único registro
+@pytest.mark.parametrize("codec, result", [
+    (FRAUD_CHECK_RESULT_CODEC, FraudCheckResult(True, False, True, 70)),
+    (BOOKING_RESULT_CODEC, BookingResult(True, 1234.5, 0.0, True)),
+    (BOOKING_RESULT_CODEC, BookingResult(False, 0, 250.25, False)),
+])
+def test_single_round_trip(codec, result):
+    data = codec.encode(result)
+    assert len(data) == codec.record_size
+    decoded = codec.decode(data)
+    assert type(decoded) is type(result)
+    assert decoded._asdict() == result._asdict()
+
+
+# C3 — Ida e volta de lotes, inclusive vazio
+@pytest.mark.parametrize("codec, make", [
+    (FRAUD_CHECK_RESULT_CODEC, random_fraud_results),
+    (BOOKING_RESULT_CODEC, random_booking_results),
+])
+@pytest.mark.parametrize("n", [0, 1, 500])
+def test_bulk_round_trip(codec, make, n):
+    results = make(random.Random(n), n)
+    buffer = codec.encode_many(results)
+    assert len(buffer) == 4 + n * codec.record_size
+    decoded = codec.decode_many(bytes(buffer))
+    assert [r._asdict() for r in decoded] == [r._asdict() for r in results]
+
+
+# C4 — Acesso direto a um registro e validação do buffer
+def test_decode_at_and_truncated_buffer():
+    results = random_booking_results(random.Random(1), 10)
+    buffer = BOOKING_RESULT_CODEC.encode_many(results)
+    assert BOOKING_RESULT_CODEC.decode_at(memoryview(buffer), 7)._asdict() == results[7]._asdict()
+    with pytest.raises(IndexError):
+        BOOKING_RESULT_CODEC.decode_at(buffer, 10)
+    with pytest.raises(ValueError):
+        BOOKING_RESULT_CODEC.decode_many(buffer[:-1])
+
+
+# C5 — Valor fora do layout é rejeitado
+def test_out_of_range_value_is_rejected():
+    with pytest.raises(struct.error):
+        FRAUD_CHECK_RESULT_CODEC.encode(FraudCheckResult(False, False, False, 2 ** 40))
+
+
+# C6 — _asdict substitui vars() para serialização em JSON
+def test_asdict_is_json_ready():
+    result = BookingResult(True, 99.5, 0.0, False)
+    assert result._asdict() == {"confirmation": True, "total_price": 99.5, "refund_amount": 0.0, "points_used": False}
+    assert json.loads(json.dumps(FraudCheckResult(True, False, True, 70)._asdict()))["risk_score"] == 70